@@ -1,25 +1,35 @@
 """The AEMO Forecast integration."""
 
-from homeassistant.core import HomeAssistant
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 
 import logging
 import voluptuous as vol
 
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 
-from .coordinator import AEMOForecastDataUpdateCoordinator
+from .coordinator import (
+    AEMOForecastDataUpdateCoordinator,
+    async_acquire_region,
+    async_release_region,
+)
 
 from .const import (
     DOMAIN,
     CONF_STATE_ID,
+    VALID_STATE_IDS,
+    DATA_ENTRIES,
+    PLATFORMS,
 )
 
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
             {
-                vol.Required(CONF_STATE_ID): vol.In(["NSW", "QLD", "SA", "TAS", "VIC"]),
+                vol.Required(CONF_STATE_ID): vol.In(VALID_STATE_IDS),
             }
         )
     },
@@ -32,29 +42,104 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Set up the AEMO Forecast integration from a config entry."""
     _LOGGER.debug("Setting up the AEMO Forecast component from config entry.")
 
+    # The region lives in data; older options flows stored an unused copy in options
+    if CONF_STATE_ID in config_entry.options:
+        options = dict(config_entry.options)
+        options.pop(CONF_STATE_ID)
+        hass.config_entries.async_update_entry(config_entry, options=options)
+
+    state_id = config_entry.data[CONF_STATE_ID]
+
+    # Share the region forecast with any other entries for the same region
+    try:
+        region = await async_acquire_region(hass, state_id, config_entry.entry_id)
+    except Exception as err:
+        _LOGGER.error("Error initializing region coordinator: %s", err)
+        await async_release_region(hass, state_id, config_entry.entry_id)
+        return False
+
     # Initialize coordinator
-    coordinator = AEMOForecastDataUpdateCoordinator(hass, config_entry)
+    coordinator = AEMOForecastDataUpdateCoordinator(hass, config_entry, region)
 
     try:
         await coordinator.async_refresh()
         if not coordinator.last_update_success:
             _LOGGER.error("Initial data fetch failed")
+            await async_release_region(hass, state_id, config_entry.entry_id)
             return False
     except Exception as err:
         _LOGGER.error("Error initializing coordinator: %s", err)
+        await async_release_region(hass, state_id, config_entry.entry_id)
         return False
 
+    coordinator.async_attach_source()
+
     # Store data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]['coordinator'] = coordinator
+    hass.data.setdefault(DOMAIN, {}).setdefault(DATA_ENTRIES, {})
+    hass.data[DOMAIN][DATA_ENTRIES][config_entry.entry_id] = coordinator
+
+    # Entries that fail to set up are never unloaded, so tear down here
+    try:
+        await _async_migrate_unique_ids(hass, config_entry)
+
+        # Load the sensor and number platforms
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    except Exception:
+        await _async_teardown_entry(hass, config_entry)
+        raise
+
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_update_listener))
+
+    return True
 
-    # Load the sensor platform
-    await hass.config_entries.async_forward_entry_setups(config_entry, ["sensor"])
-    await hass.config_entries.async_forward_entry_setups(config_entry, ["number"])
+
+async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Unload an AEMO Forecast config entry."""
+    _LOGGER.debug("Unloading AEMO Forecast config entry %s.", config_entry.entry_id)
+
+    unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    if not unload_ok:
+        return False
+
+    await _async_teardown_entry(hass, config_entry)
 
     return True
 
 
+async def _async_teardown_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Shut down an entry's coordinator and release its region."""
+    coordinator: AEMOForecastDataUpdateCoordinator = hass.data[DOMAIN][DATA_ENTRIES].pop(config_entry.entry_id)
+    coordinator.async_detach_source()
+    await coordinator.async_shutdown()
+
+    await async_release_region(hass, coordinator.state_id, config_entry.entry_id)
+
+
+async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Reload the entry when its region is changed through the options flow."""
+    coordinator = hass.data[DOMAIN][DATA_ENTRIES].get(config_entry.entry_id)
+
+    # Threshold changes from the number entity are applied in place
+    if coordinator is not None and coordinator.state_id != config_entry.data[CONF_STATE_ID]:
+        await hass.config_entries.async_reload(config_entry.entry_id)
+
+
+async def _async_migrate_unique_ids(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Move entities from per-region unique IDs to per-entry unique IDs."""
+    # Match every region, the entities may predate a change of region
+    old_prefixes = [f"{DOMAIN}_{state_id}_" for state_id in VALID_STATE_IDS]
+    new_prefix = f"{DOMAIN}_{config_entry.entry_id}_"
+
+    @callback
+    def _migrate(entity_entry: er.RegistryEntry) -> dict[str, Any] | None:
+        for old_prefix in old_prefixes:
+            if entity_entry.unique_id.startswith(old_prefix):
+                return {"new_unique_id": new_prefix + entity_entry.unique_id[len(old_prefix):]}
+        return None
+
+    await er.async_migrate_entries(hass, config_entry.entry_id, _migrate)
+
+
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the AEMO Forecast component."""
     _LOGGER.debug("Setting up the AEMO Forecast component.")
@@ -63,10 +148,8 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
 def validate_state_id(state_id):
     """Validate the state id key."""
-    valid_state_ids = ["NSW", "QLD", "SA", "TAS", "VIC"]
-
     # Check if the API key is of the expected length and a valid hexadecimal
-    if state_id in valid_state_ids:
+    if state_id in VALID_STATE_IDS:
         return True
     else:
         _LOGGER.error("Invalid state ID.")
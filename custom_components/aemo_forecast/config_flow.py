@@ -6,7 +6,7 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, CONF_STATE_ID
+from .const import DOMAIN, CONF_STATE_ID, VALID_STATE_IDS
 from . import validate_state_id
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,10 +15,23 @@ _LOGGER = logging.getLogger(__name__)
 def build_data_schema(existing_data):
     return vol.Schema(
         {
-            vol.Required(CONF_STATE_ID, default=existing_data.get(CONF_STATE_ID, "NSW")): vol.In(["NSW", "QLD", "SA", "TAS", "VIC"]),
+            vol.Required(CONF_STATE_ID, default=existing_data.get(CONF_STATE_ID, "NSW")): vol.In(VALID_STATE_IDS),
         }
     )
 
+def build_title(state_id, other_entries):
+    """Return the entry title for a region, numbered if the plain title is taken."""
+    title = f"AEMO Forecast: {state_id}"
+    used_titles = {entry.title for entry in other_entries}
+    if title not in used_titles:
+        return title
+
+    # Titles name the devices, so reuse the lowest free number
+    suffix = 2
+    while f"{title} ({suffix})" in used_titles:
+        suffix += 1
+    return f"{title} ({suffix})"
+
 class AEMOForecastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for the AEMO Forecast integration."""
 
@@ -38,7 +51,8 @@ class AEMOForecastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors[CONF_STATE_ID] = "invalid_state_id"
 
             if not errors:
-                title = f"AEMO Forecast: {user_input[CONF_STATE_ID]}"
+                title = build_title(user_input[CONF_STATE_ID], self._async_current_entries())
+
                 # Save the configuration and create the entry
                 return self.async_create_entry(title=title, data=user_input)
                 
@@ -68,11 +82,28 @@ class AEMOForecastOptionsFlowHandler(config_entries.OptionsFlow):
         errors = {}
 
         if user_input is not None:
-            # Save the updated options
-            return self.async_create_entry(title="", data=user_input)
-
-        # Pre-populate with existing options
-        options = self.config_entry.options
+            # The region is stored in data, the update listener reloads the entry
+            if user_input[CONF_STATE_ID] != self.config_entry.data[CONF_STATE_ID]:
+                other_entries = [
+                    entry for entry in self.hass.config_entries.async_entries(DOMAIN)
+                    if entry.entry_id != self.config_entry.entry_id
+                ]
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    title=build_title(user_input[CONF_STATE_ID], other_entries),
+                    data={**self.config_entry.data, CONF_STATE_ID: user_input[CONF_STATE_ID]},
+                )
+
+            # Keep the remaining options, such as the threshold price
+            options = {
+                key: value
+                for key, value in self.config_entry.options.items()
+                if key != CONF_STATE_ID
+            }
+            return self.async_create_entry(title="", data=options)
+
+        # Pre-populate with the existing configuration
+        existing_data = {**self.config_entry.data, **self.config_entry.options}
         return self.async_show_form(
-            step_id="user", data_schema=build_data_schema(options), errors=errors
+            step_id="user", data_schema=build_data_schema(existing_data), errors=errors
         )
\ No newline at end of file
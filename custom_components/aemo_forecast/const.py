@@ -4,9 +4,21 @@ DOMAIN = "aemo_forecast"
 
 CONF_STATE_ID = "state_id"
 
+VALID_STATE_IDS = ["NSW", "QLD", "SA", "TAS", "VIC"]
+
+# hass.data[DOMAIN] keys
+DATA_ENTRIES = "entries"  # entry_id -> entry coordinator
+DATA_REGIONS = "regions"  # state_id -> shared region coordinator
+DATA_REPORT = "report"  # Report coordinator shared by all regions
+
+PLATFORMS = ["sensor", "number"]
+
 # Number keys
 THRESHOLD_PRICE = "thresholdPrice"  # Threshold price in $/kWh
 
+# Snapshot keys
+GENERATION = "generation"  # Incremented on every entry coordinator update
+
 # Sensor keys
 SPIKE_WINDOWS = "spike_windows"
 ABOVE_THRESHOLD_DURATION = "above_threshold_duration"
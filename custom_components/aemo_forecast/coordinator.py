@@ -1,5 +1,6 @@
 """Coordinator for AEMO Forecast integration."""
 
+import asyncio
 import datetime
 import logging
 import json
@@ -7,52 +8,47 @@ from typing import Any
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.config_entries import ConfigEntry
 
 import aiohttp
 
-from .const import CONF_STATE_ID, SPIKE_WINDOWS, ABOVE_THRESHOLD_DURATION, NEXT_SPIKE_WINDOW, NEXT_SPIKE_WINDOW_PRICE, TOTAL_FORECAST_DURATION, MAX_PRICE, MAX_PRICE_TIME, MIN_PRICE, MIN_PRICE_TIME, THRESHOLD_PRICE
+from .const import DOMAIN, DATA_REGIONS, DATA_REPORT, GENERATION, SPIKE_WINDOWS, ABOVE_THRESHOLD_DURATION, NEXT_SPIKE_WINDOW, NEXT_SPIKE_WINDOW_PRICE, TOTAL_FORECAST_DURATION, MAX_PRICE, MAX_PRICE_TIME, MIN_PRICE, MIN_PRICE_TIME, THRESHOLD_PRICE
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=5)  # Update every 5 minutes
 
-class AEMOForecastDataUpdateCoordinator(DataUpdateCoordinator):
-    """DataUpdateCoordinator to manage fetching data from AEMOForecast API."""
+class AEMOReportDataUpdateCoordinator(DataUpdateCoordinator):
+    """DataUpdateCoordinator which fetches the forecast report for every region.
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the coordinator."""
-        self.config_entry = config_entry
-
-        self.state_id = config_entry.data[CONF_STATE_ID]
-        
-        # Initialize attributes for storing number data
-        self.numbers: dict[str, float] = {}
-        self.numbers[THRESHOLD_PRICE] = config_entry.options.get(THRESHOLD_PRICE, 1.0)
-        
-        self.data: dict[str, Any] = {}
+    The report covers the whole NEM, so a single instance is shared by all
+    region coordinators and the payload is downloaded and split once per update.
+    """
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coordinator."""
+        self.first_refresh_lock = asyncio.Lock()
+        self.lastUpdate: datetime | None = None
 
         super().__init__(
             hass,
             _LOGGER,
-            name="AEMO Forecast Data",
+            # Shared by all config entries, so it is not bound to one
+            config_entry=None,
+            name="AEMO Forecast Report",
             update_interval=SCAN_INTERVAL,
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> dict[str, list[dict[str, Any]]]:
         """Fetch data from the API endpoint."""
-        
+
         url: str = "https://visualisations.aemo.com.au/aemo/apps/api/report/5MIN"
         payload : dict[str, list[str]] = {"timeScale": ["30MIN"]}
 
@@ -68,13 +64,13 @@ class AEMOForecastDataUpdateCoordinator(DataUpdateCoordinator):
 
                 response.raise_for_status()
                 data: Any = await response.json()
-                
+
                 # Check if the response contains a key called "5MIN"
                 if "5MIN" not in data:
                     _LOGGER.warning("No data received")
-                    raise UpdateFailed("No data received")               
-        
-        
+                    raise UpdateFailed("No data received")
+
+
         except aiohttp.ClientError as e:
             _LOGGER.error("Failed to fetch data: %s", str(e))
             raise UpdateFailed(f"Error communicating with API: {e}") from e
@@ -83,26 +79,263 @@ class AEMOForecastDataUpdateCoordinator(DataUpdateCoordinator):
         # Extract the "5MIN" array from the response
         entries = data.get("5MIN", [])
 
-        # Filter entries: REGION == "NSW1" AND PERIODTYPE == "FORECAST"
-        filtered = [
-            entry for entry in entries
-            if entry.get("REGION") == f"{self.state_id}1" and entry.get("PERIODTYPE") == "FORECAST"
-        ]
+        # Group forecast entries by REGION, e.g. "NSW1"
+        forecasts: dict[str, list[dict[str, Any]]] = {}
+        for entry in entries:
+            if entry.get("PERIODTYPE") == "FORECAST":
+                forecasts.setdefault(entry.get("REGION"), []).append(entry)
+
+        self.lastUpdate = datetime.now()
+
+        return forecasts
+
+
+class AEMODerivedDataUpdateCoordinator(DataUpdateCoordinator):
+    """DataUpdateCoordinator whose data is computed from another coordinator.
+
+    It has no update interval of its own and is recomputed whenever the
+    source coordinator updates.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        source: DataUpdateCoordinator,
+        config_entry: ConfigEntry | None,
+        name: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.source = source
+        self._unsub_source = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=config_entry,
+            name=name,
+        )
+
+    @callback
+    def async_attach_source(self) -> None:
+        """Start recomputing whenever the source coordinator is updated."""
+        if self._unsub_source is None:
+            self._unsub_source = self.source.async_add_listener(self.async_update_from_source)
+
+    @callback
+    def async_detach_source(self) -> None:
+        """Stop listening to the source coordinator."""
+        if self._unsub_source is not None:
+            self._unsub_source()
+            self._unsub_source = None
+
+    @callback
+    def async_update_from_source(self) -> None:
+        """Recompute the data from the source coordinator."""
+        try:
+            data = self._compute_data()
+        except UpdateFailed as err:
+            if self.last_update_success:
+                _LOGGER.error("Error updating %s: %s", self.name, err)
+            self.last_exception = err
+            self.last_update_success = False
+            self.async_update_listeners()
+            return
+
+        self.async_set_updated_data(data)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Recompute the data from the source coordinator."""
+        return self._compute_data()
+
+    def _compute_data(self) -> dict[str, Any]:
+        """Compute the data from the source coordinator's data."""
+        raise NotImplementedError
+
+
+class AEMORegionDataUpdateCoordinator(AEMODerivedDataUpdateCoordinator):
+    """DataUpdateCoordinator which summarises the forecast for one region.
+
+    A single instance is shared by every config entry watching the same region,
+    see async_acquire_region and async_release_region.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        report: AEMOReportDataUpdateCoordinator,
+        state_id: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.report = report
+        self.state_id = state_id
+
+        # Config entries currently holding a reference to this region
+        self.entry_ids: set[str] = set()
+        self.lastUpdate: datetime | None = None
+
+        # The region outlives whichever entry created it, so it is not bound to one
+        super().__init__(hass, report, None, f"AEMO Forecast Data {state_id}")
+
+    def _compute_data(self) -> dict[str, Any]:
+        """Compute the threshold independent stats for the region."""
+        if not self.report.last_update_success or self.report.data is None:
+            raise UpdateFailed("No forecast data available")
+
+        # Forecast entries for this region, e.g. REGION == "NSW1"
+        filtered = self.report.data.get(f"{self.state_id}1", [])
 
         # Build array of dictionaries with SETTLEMENTDATE and RRP converted to $/kWh
         time_rrp_array = [
             {
                 "time": entry["SETTLEMENTDATE"],
+                "datetime": datetime.fromisoformat(entry["SETTLEMENTDATE"]),
                 "rrp": entry["RRP"] / 1000.0  # Convert from $/MWh to $/kWh
             }
             for entry in filtered
         ]
 
-        self.data = {}
-        self.data["time_rrp_array"] = time_rrp_array
+        region_data: dict[str, Any] = {}
+        region_data["time_rrp_array"] = time_rrp_array
+
+        # --------------------------------------------
+        # Compute threshold independent stats
+        # --------------------------------------------
+        if not time_rrp_array:
+            _LOGGER.warning("No forecast data available to compute statistics.")
+            raise UpdateFailed("No forecast data available")
+
+        times = [item["datetime"] for item in time_rrp_array]
+        region_data["forecast_start"] = min(times)
+        region_data["forecast_end"] = max(times)
+
+        # Determine total forecast duration
+        if len(times) > 1:
+            region_data[TOTAL_FORECAST_DURATION] = (region_data["forecast_end"] - region_data["forecast_start"]).total_seconds() / 60 # Duration in minutes
+        else:
+            _LOGGER.warning("Only one time entry found in forecast data.")
+
+        # Determine the maximum price in the forecast
+        max_rrp = max(time_rrp_array, key=lambda x: x["rrp"], default=None)
+        if not max_rrp:
+            _LOGGER.warning("No maximum price found in forecast data.")
+            raise UpdateFailed("No maximum price found in forecast data")
+
+        # Determine the minimum price in the forecast
+        min_rrp = min(time_rrp_array, key=lambda x: x["rrp"], default=None)
+        if not min_rrp:
+            _LOGGER.warning("No minimum price found in forecast data.")
+            raise UpdateFailed("No minimum price found in forecast data")
+
+        region_data[MAX_PRICE] = max_rrp["rrp"]
+        region_data[MAX_PRICE_TIME] = max_rrp["time"]
+        region_data[MIN_PRICE] = min_rrp["rrp"]
+        region_data[MIN_PRICE_TIME] = min_rrp["time"]
+
+        self.lastUpdate = self.report.lastUpdate
+
+        return region_data
+
+
+async def async_acquire_region(hass: HomeAssistant, state_id: str, entry_id: str) -> AEMORegionDataUpdateCoordinator:
+    """Return the shared region coordinator, registering entry_id as a user of it."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+
+    report: AEMOReportDataUpdateCoordinator | None = domain_data.get(DATA_REPORT)
+    if report is None:
+        report = AEMOReportDataUpdateCoordinator(hass)
+        domain_data[DATA_REPORT] = report
+
+    # Only the first entry needs to wait on a fetch, regions are updated as listeners
+    async with report.first_refresh_lock:
+        if report.data is None or not report.last_update_success:
+            await report.async_refresh()
+
+    regions: dict[str, AEMORegionDataUpdateCoordinator] = domain_data.setdefault(DATA_REGIONS, {})
+
+    region = regions.get(state_id)
+    if region is None:
+        region = AEMORegionDataUpdateCoordinator(hass, report, state_id)
+        regions[state_id] = region
+        region.async_attach_source()
+        region.async_update_from_source()
+
+    region.entry_ids.add(entry_id)
+
+    return region
+
+
+async def async_release_region(hass: HomeAssistant, state_id: str, entry_id: str) -> None:
+    """Drop entry_id's reference to a region, shutting it down once unused."""
+    domain_data: dict[str, Any] = hass.data.get(DOMAIN, {})
+    regions: dict[str, AEMORegionDataUpdateCoordinator] = domain_data.get(DATA_REGIONS, {})
+
+    region = regions.get(state_id)
+    if region is not None:
+        region.entry_ids.discard(entry_id)
+        if region.entry_ids:
+            return
+
+        _LOGGER.debug("No entries left for region %s, shutting down.", state_id)
+        regions.pop(state_id)
+        region.async_detach_source()
+        await region.async_shutdown()
+
+    # The report is only needed while some region uses it
+    if not regions and DATA_REPORT in domain_data:
+        report: AEMOReportDataUpdateCoordinator = domain_data.pop(DATA_REPORT)
+        await report.async_shutdown()
+
+
+class AEMOForecastDataUpdateCoordinator(AEMODerivedDataUpdateCoordinator):
+    """DataUpdateCoordinator which applies one config entry's threshold to a region forecast."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        region: AEMORegionDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.region = region
+
+        self.state_id = region.state_id
+
+        # Initialize attributes for storing number data
+        self.numbers: dict[str, float] = {}
+        self.numbers[THRESHOLD_PRICE] = config_entry.options.get(THRESHOLD_PRICE, 1.0)
+
+        self.lastUpdate: datetime | None = None
+        self.generation = 0
+
+        super().__init__(
+            hass,
+            region,
+            config_entry,
+            f"AEMO Forecast Data {self.state_id} ({config_entry.entry_id})",
+        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device grouping this entry's entities."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.config_entry.entry_id)},
+            name=self.config_entry.title,
+            manufacturer="AEMO",
+            model=f"{self.state_id} price forecast",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    def _compute_data(self) -> dict[str, Any]:
+        """Apply the threshold to the latest region forecast."""
+        if not self.region.last_update_success or not self.region.data:
+            raise UpdateFailed("No forecast data available")
+
+        # Region data is shared between entries, so copy rather than mutate it
+        data: dict[str, Any] = dict(self.region.data)
+        time_rrp_array = data["time_rrp_array"]
 
         # --------------------------------------------
-        # Compute key stats
+        # Compute threshold dependent stats
         # --------------------------------------------
         if THRESHOLD_PRICE not in self.numbers:
             _LOGGER.warning("Threshold price not set, using default value of 1.0 $/kWh")
@@ -110,53 +343,25 @@ class AEMOForecastDataUpdateCoordinator(DataUpdateCoordinator):
 
         threshold = self.numbers[THRESHOLD_PRICE]  # Threshold in $/kWh
 
-        if not time_rrp_array:
-            _LOGGER.warning("No forecast data available to compute statistics.")
-            raise UpdateFailed("No forecast data available")
-        else:
-            times = [datetime.fromisoformat(item["time"]) for item in time_rrp_array]
-            self.data["forecast_start"] = min(times)
-            self.data["forecast_end"] = max(times)
-
-            # Determine total forecast duration
-            if len(times) > 1:
-                self.data[TOTAL_FORECAST_DURATION] = (self.data["forecast_end"] - self.data["forecast_start"]).total_seconds() / 60 # Duration in minutes
-            else:
-                _LOGGER.warning("Only one time entry found in forecast data.")
-
-            # Find first time RRP exceeds threshold
-            self.data[NEXT_SPIKE_WINDOW] = None
-            self.data[NEXT_SPIKE_WINDOW_PRICE] = None
-            for item in time_rrp_array:
-                if item["rrp"] > threshold:
-                    time = datetime.fromisoformat(item["time"])
-                    time_with_timezone = time.astimezone(ZoneInfo("Australia/Sydney"))
-                    self.data[NEXT_SPIKE_WINDOW] = time_with_timezone
-                    self.data[NEXT_SPIKE_WINDOW_PRICE] = item["rrp"]
-                    break
-            
-            # Determine the maximum price in the forecast
-            max_rrp = max(time_rrp_array, key=lambda x: x["rrp"], default=None)
-            if not max_rrp:
-                _LOGGER.warning("No maximum price found in forecast data.")
-                raise UpdateFailed("No maximum price found in forecast data")
-
-            # Determine the minimum price in the forecast
-            min_rrp = min(time_rrp_array, key=lambda x: x["rrp"], default=None)
-            if not min_rrp:
-                _LOGGER.warning("No minimum price found in forecast data.")
-                raise UpdateFailed("No minimum price found in forecast data")
-            
-            self.data[MAX_PRICE] = max_rrp["rrp"]
-            self.data[MAX_PRICE_TIME] = max_rrp["time"]
-            self.data[MIN_PRICE] = min_rrp["rrp"]
-            self.data[MIN_PRICE_TIME] = min_rrp["time"]
-
-            # Count periods RRP > threshold
-            self.data[SPIKE_WINDOWS] = sum(1 for item in time_rrp_array if item["rrp"] > threshold)
-            self.data[ABOVE_THRESHOLD_DURATION] = self.data[SPIKE_WINDOWS] * 30 # Duration in minutes
+        # Find first time RRP exceeds threshold
+        data[NEXT_SPIKE_WINDOW] = None
+        data[NEXT_SPIKE_WINDOW_PRICE] = None
+        for item in time_rrp_array:
+            if item["rrp"] > threshold:
+                time_with_timezone = item["datetime"].astimezone(ZoneInfo("Australia/Sydney"))
+                data[NEXT_SPIKE_WINDOW] = time_with_timezone
+                data[NEXT_SPIKE_WINDOW_PRICE] = item["rrp"]
+                break
 
-        self.lastUpdate = datetime.now()
+        # Count periods RRP > threshold
+        data[SPIKE_WINDOWS] = sum(1 for item in time_rrp_array if item["rrp"] > threshold)
+        data[ABOVE_THRESHOLD_DURATION] = data[SPIKE_WINDOWS] * 30 # Duration in minutes
+
+        self.lastUpdate = self.region.lastUpdate
+
+        # Lets entities reuse state computed for an unchanged snapshot
+        self.generation += 1
+        data[GENERATION] = self.generation
 
-        # Return self.data to comply with DataUpdateCoordinator requirements
-        return self.data
\ No newline at end of file
+        # Return data to comply with DataUpdateCoordinator requirements
+        return data
@@ -4,7 +4,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, THRESHOLD_PRICE
+from .const import DOMAIN, DATA_ENTRIES, THRESHOLD_PRICE
 
 from .coordinator import AEMOForecastDataUpdateCoordinator
 
@@ -14,7 +14,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Setup the threshold price number entity."""
-    coordinator = hass.data[DOMAIN]['coordinator']
+    coordinator = hass.data[DOMAIN][DATA_ENTRIES][config_entry.entry_id]
     
     async_add_entities(
         [
@@ -32,6 +32,8 @@ class AEMOForecastNumber(NumberEntity, CoordinatorEntity):
         super().__init__(coordinator)
         self.data_key = data_key
         self._attr_name = name
+        self._attr_has_entity_name = True
+        self._attr_device_info = coordinator.device_info
 
         if data_key not in coordinator.numbers:
             self.coordinator.numbers[data_key] = 1.0
@@ -57,8 +59,8 @@ class AEMOForecastThresholdPrice(AEMOForecastNumber):
     _attr_native_unit_of_measurement = "$/kWh"
     
     def __init__(self, coordinator: AEMOForecastDataUpdateCoordinator):
-        super().__init__(coordinator, "AEMO Forecast Threshold Price", THRESHOLD_PRICE)
-        self._attr_unique_id = f"aemo_forecast_{coordinator.state_id}_{THRESHOLD_PRICE}"
+        super().__init__(coordinator, "Threshold Price", THRESHOLD_PRICE)
+        self._attr_unique_id = f"aemo_forecast_{coordinator.config_entry.entry_id}_{THRESHOLD_PRICE}"
 
     async def async_set_native_value(self, value: float):
         self.coordinator.numbers[self.data_key] = value
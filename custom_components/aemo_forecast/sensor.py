@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,7 +16,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.const import UnitOfTime
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SPIKE_WINDOWS, ABOVE_THRESHOLD_DURATION, NEXT_SPIKE_WINDOW, NEXT_SPIKE_WINDOW_PRICE, TOTAL_FORECAST_DURATION, MAX_PRICE, MAX_PRICE_TIME, MIN_PRICE, MIN_PRICE_TIME
+from .const import DOMAIN, DATA_ENTRIES, GENERATION, SPIKE_WINDOWS, ABOVE_THRESHOLD_DURATION, NEXT_SPIKE_WINDOW, NEXT_SPIKE_WINDOW_PRICE, TOTAL_FORECAST_DURATION, MAX_PRICE, MAX_PRICE_TIME, MIN_PRICE, MIN_PRICE_TIME
 
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -30,7 +31,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up AEMO Forecast sensors from a config entry."""
 
-    coordinator = hass.data[DOMAIN]['coordinator']
+    coordinator = hass.data[DOMAIN][DATA_ENTRIES][config_entry.entry_id]
 
     async_add_entities(
         [
@@ -52,27 +53,44 @@ class AEMOForecastSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.data_key = data_key
         self._attr_should_poll = False  # DataUpdateCoordinator handles updates
-        self._last_value = None  # Store the last known value
+        self._attr_has_entity_name = True
+        self._attr_device_info = coordinator.device_info
+
+        # State and attributes computed for the snapshot with this generation
+        self._cached_generation = None
+        self._cached_value = None
+        self._cached_attributes: dict[str, Any] = {}
+
+    def _update_cache(self) -> None:
+        """Recompute the state and attributes if the snapshot has changed."""
+        data = self.coordinator.data or {}
+        generation = data.get(GENERATION)
+        if generation is not None and generation == self._cached_generation:
+            return
+
+        self._cached_generation = generation
+        self._cached_value = data.get(self.data_key)
+        self._cached_attributes = self._build_attributes(data)
+
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Build the additional state attributes for a snapshot."""
+        last_update = self.coordinator.lastUpdate
+
+        return {
+            "lastUpdate": last_update.isoformat() if last_update else None,
+        }
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        item = self.coordinator.data
-        if item:
-            value = item.get(self.data_key)
-            if value is not None:
-                self._last_value = value
-        
-        return value
+        self._update_cache()
+        return self._cached_value
 
     @property
     def extra_state_attributes(self):
         """Return additional state attributes."""
-        last_update = self.coordinator.lastUpdate
-
-        return {
-            "lastUpdate": last_update.isoformat() if last_update else None,
-        }
+        self._update_cache()
+        return self._cached_attributes
 
 
 class AEMOForecastSpikeWindowsSensor(AEMOForecastSensor):
@@ -83,8 +101,8 @@ class AEMOForecastSpikeWindowsSensor(AEMOForecastSensor):
     def __init__(self, coordinator):
         """Initialize the spike windows sensor."""
         super().__init__(coordinator, SPIKE_WINDOWS)
-        self._attr_name = "AEMO Forecast Spike Windows"
-        self._attr_unique_id = f"aemo_forecast_{coordinator.state_id}_{SPIKE_WINDOWS}"
+        self._attr_name = "Spike Windows"
+        self._attr_unique_id = f"aemo_forecast_{coordinator.config_entry.entry_id}_{SPIKE_WINDOWS}"
 
 class AEMOForecastAboveThresholdDurationSensor(AEMOForecastSensor):
     """Sensor which shows the duration above threshold in the forecast."""
@@ -95,8 +113,8 @@ class AEMOForecastAboveThresholdDurationSensor(AEMOForecastSensor):
     def __init__(self, coordinator):
         """Initialize the above threshold duration sensor."""
         super().__init__(coordinator, ABOVE_THRESHOLD_DURATION)
-        self._attr_name = "AEMO Forecast Forecast Above Threshold Duration"
-        self._attr_unique_id = f"aemo_forecast_{coordinator.state_id}_{ABOVE_THRESHOLD_DURATION}"
+        self._attr_name = "Above Threshold Duration"
+        self._attr_unique_id = f"aemo_forecast_{coordinator.config_entry.entry_id}_{ABOVE_THRESHOLD_DURATION}"
 
 class AEMOForecastNextSpikeWindowSensor(AEMOForecastSensor):
     """Sensor which shows the next spike window in the forecast."""
@@ -106,15 +124,15 @@ class AEMOForecastNextSpikeWindowSensor(AEMOForecastSensor):
     def __init__(self, coordinator):
         """Initialize the next spike window sensor."""
         super().__init__(coordinator, NEXT_SPIKE_WINDOW)
-        self._attr_name = "AEMO Forecast Next Spike Window"
-        self._attr_unique_id = f"aemo_forecast_{coordinator.state_id}_{NEXT_SPIKE_WINDOW}"
+        self._attr_name = "Next Spike Window"
+        self._attr_unique_id = f"aemo_forecast_{coordinator.config_entry.entry_id}_{NEXT_SPIKE_WINDOW}"
     
-    @property
-    def extra_state_attributes(self):
-        # Start with the base attributes defined in LocalvoltsSensor
-        attributes = super().extra_state_attributes
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Add the price at the next spike window to the base attributes."""
+        # Start with the base attributes defined in AEMOForecastSensor
+        attributes = super()._build_attributes(data)
 
-        price_at_next_spike = self.coordinator.data.get(NEXT_SPIKE_WINDOW_PRICE)
+        price_at_next_spike = data.get(NEXT_SPIKE_WINDOW_PRICE)
         if price_at_next_spike is not None:
             attributes[NEXT_SPIKE_WINDOW_PRICE] = price_at_next_spike
             attributes[f"{NEXT_SPIKE_WINDOW_PRICE}_unit"] = "$/kWh"
@@ -133,8 +151,8 @@ class AEMOForecastTotalForecastDurationSensor(AEMOForecastSensor):
     def __init__(self, coordinator):
         """Initialize the total forecast duration sensor."""
         super().__init__(coordinator, TOTAL_FORECAST_DURATION)
-        self._attr_name = "AEMO Forecast Total Forecast Duration"
-        self._attr_unique_id = f"aemo_forecast_{coordinator.state_id}_{TOTAL_FORECAST_DURATION}"
+        self._attr_name = "Total Forecast Duration"
+        self._attr_unique_id = f"aemo_forecast_{coordinator.config_entry.entry_id}_{TOTAL_FORECAST_DURATION}"
 
 class AEMOForecastMaxPriceSensor(AEMOForecastSensor):
     """Sensor which shows the maximum price in the forecast."""
@@ -145,15 +163,15 @@ class AEMOForecastMaxPriceSensor(AEMOForecastSensor):
     def __init__(self, coordinator):
         """Initialize the maximum price sensor."""
         super().__init__(coordinator, MAX_PRICE)
-        self._attr_name = "AEMO Forecast Maximum Forecasted Price"
-        self._attr_unique_id = f"aemo_forecast_{coordinator.state_id}_{MAX_PRICE}"
+        self._attr_name = "Maximum Forecasted Price"
+        self._attr_unique_id = f"aemo_forecast_{coordinator.config_entry.entry_id}_{MAX_PRICE}"
     
-    @property
-    def extra_state_attributes(self):
-        # Start with the base attributes defined in LocalvoltsSensor
-        attributes = super().extra_state_attributes
-        # Add the 'demandInterval' attribute if it's available in the coordinator data
-        time_of_max = self.coordinator.data.get(MAX_PRICE_TIME)
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Add the time of the maximum price to the base attributes."""
+        # Start with the base attributes defined in AEMOForecastSensor
+        attributes = super()._build_attributes(data)
+        # Add the MAX_PRICE_TIME attribute if it's available in the snapshot
+        time_of_max = data.get(MAX_PRICE_TIME)
         if time_of_max is not None:
             attributes[MAX_PRICE_TIME] = time_of_max
         return attributes
@@ -167,15 +185,15 @@ class AEMOForecastMinPriceSensor(AEMOForecastSensor):
     def __init__(self, coordinator):
         """Initialize the minimum price sensor."""
         super().__init__(coordinator, MIN_PRICE)
-        self._attr_name = "AEMO Forecast Minimum Forecasted Price"
-        self._attr_unique_id = f"aemo_forecast_{coordinator.state_id}_{MIN_PRICE}"
+        self._attr_name = "Minimum Forecasted Price"
+        self._attr_unique_id = f"aemo_forecast_{coordinator.config_entry.entry_id}_{MIN_PRICE}"
     
-    @property
-    def extra_state_attributes(self):
-        # Start with the base attributes defined in LocalvoltsSensor
-        attributes = super().extra_state_attributes
-        # Add the 'demandInterval' attribute if it's available in the coordinator data
-        time_of_min = self.coordinator.data.get(MIN_PRICE_TIME)
+    def _build_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Add the time of the minimum price to the base attributes."""
+        # Start with the base attributes defined in AEMOForecastSensor
+        attributes = super()._build_attributes(data)
+        # Add the MIN_PRICE_TIME attribute if it's available in the snapshot
+        time_of_min = data.get(MIN_PRICE_TIME)
         if time_of_min is not None:
             attributes[MIN_PRICE_TIME] = time_of_min
         return attributes
\ No newline at end of file